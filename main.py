@@ -6,9 +6,13 @@ Usage (from project root):
 
 This will:
 - Load all CSVs from the `data/` directory (with robust encoding handling).
-- Print basic information (shape, columns, head) for each file.
+- Print basic information (shape, columns) for each file; pass
+  verbose=True to run_preprocessing to also print head() and dtype counts.
 - Attempt to identify a review-containing file and column.
-- Clean and tokenize reviews and compute a sentiment score using TextBlob.
+- Clean and tokenize reviews and compute a sentiment score: by default the
+  mean TextBlob lexicon polarity of each review's tokens; pass
+  sentiment_backend="textblob" to run_preprocessing for the full TextBlob
+  analyzer (slower; parallelize it with n_jobs).
 """
 
 from src import preprocess
@@ -20,6 +24,7 @@ def main() -> None:
         data_dir="data",
         review_file_hint=None,  # e.g. "review" or "comments" if you have such a file
         review_col_candidates=["review", "reviews", "review_text", "text"],
+        sentiment_backend="lexicon",  # or "textblob" for full TextBlob polarity
     )
 
 
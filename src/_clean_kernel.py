@@ -0,0 +1,108 @@
+"""Numba kernel implementing clean_text() over a flat buffer of ASCII reviews.
+
+Reviews are passed as one uint8 buffer plus int64 row offsets (the Arrow
+large_string layout) and cleaned in parallel, in a single pass over the bytes
+and without creating Python strings.
+Only valid for ASCII rows: Python's str.lower()/str.split() treat some
+non-ASCII characters (e.g. 'É', NBSP, non-Latin digits) specially.
+"""
+
+import string
+
+import numpy as np
+from numba import njit, prange
+
+KEEP, DROP, SPLIT = 0, 1, 2
+
+
+def _byte_tables():
+    """Per-byte class (keep/drop/split) and lowercase mapping."""
+    byte_class = np.full(256, KEEP, dtype=np.uint8)
+    byte_lower = np.arange(256, dtype=np.uint8)
+    for b in range(128):
+        c = chr(b)
+        if c in string.punctuation:
+            byte_class[b] = DROP  # deleted, like PUNCT_TABLE
+        elif c.isdecimal() or c.isspace():
+            byte_class[b] = SPLIT  # digits become spaces; str.split() separators
+        elif "A" <= c <= "Z":
+            byte_lower[b] = b | 0x20
+    return byte_class, byte_lower
+
+
+BYTE_CLASS, BYTE_LOWER = _byte_tables()
+
+
+def stopword_dfa(words):
+    """Trie DFA over the ASCII stopwords: (transitions, accepting states).
+
+    State 0 is the start state and -1 the dead state. Walking a token's bytes
+    through it while scanning tells, exactly and without hashing, whether the
+    whole token is a stopword.
+    """
+    transitions = [np.full(256, -1, dtype=np.int32)]
+    accepting = [False]
+    for word in words:
+        if not word.isascii():
+            continue
+        state = 0
+        for b in word.encode("ascii"):
+            if transitions[state][b] < 0:
+                transitions[state][b] = len(transitions)
+                transitions.append(np.full(256, -1, dtype=np.int32))
+                accepting.append(False)
+            state = transitions[state][b]
+        accepting[state] = True
+    return np.stack(transitions), np.array(accepting, dtype=np.bool_)
+
+
+@njit(parallel=True, boundscheck=False, cache=True)
+def clean_buffer(buf, row_off, stop_dfa, stop_accept, byte_class, byte_lower):
+    """Clean every row of `buf`; returns (cleaned buffer, new row offsets).
+
+    Tokens in the output are joined by single spaces, as clean_text() does;
+    stopwords are matched by walking `stop_dfa` (see stopword_dfa) in the
+    same pass over the bytes.
+    """
+    n_rows = len(row_off) - 1
+    tmp = np.empty_like(buf)
+    out_len = np.zeros(n_rows, dtype=np.int64)
+
+    # A row's cleaned text is never longer than the raw text, so each row is
+    # written in place at its input offset first and compacted afterwards.
+    for i in prange(n_rows):
+        start = row_off[i]
+        pos = start
+        tok_begin = start
+        in_token = False
+        state = 0
+        for j in range(row_off[i], row_off[i + 1]):
+            b = buf[j]
+            cls = byte_class[b]
+            if cls == KEEP:
+                if not in_token:
+                    tok_begin = pos
+                    if pos > start:
+                        tmp[pos] = 32
+                        pos += 1
+                    in_token = True
+                    state = 0
+                lb = byte_lower[b]
+                tmp[pos] = lb
+                pos += 1
+                if state >= 0:
+                    state = stop_dfa[state, lb]
+            elif cls == SPLIT and in_token:
+                if state >= 0 and stop_accept[state]:
+                    pos = tok_begin  # drop the token and its leading space
+                in_token = False
+        if in_token and state >= 0 and stop_accept[state]:
+            pos = tok_begin
+        out_len[i] = pos - start
+
+    new_off = np.zeros(n_rows + 1, dtype=np.int64)
+    new_off[1:] = np.cumsum(out_len)
+    out = np.empty(new_off[n_rows], dtype=np.uint8)
+    for i in prange(n_rows):
+        out[new_off[i] : new_off[i + 1]] = tmp[row_off[i] : row_off[i] + out_len[i]]
+    return out, new_off
@@ -1,18 +1,25 @@
 import os
-import glob
-import pandas as pd
 
+try:
+    from src.preprocess import find_csvs, iter_csvs
+except ImportError:  # run as a script from inside src/
+    from preprocess import find_csvs, iter_csvs
 
-def load_and_inspect_data(data_dir: str = "data") -> None:
+
+def load_and_inspect_data(data_dir: str = "data", verbose: bool = False) -> None:
     """Load all CSV files in data_dir and print basic info.
 
     - Lists CSV files found.
-    - For each file, prints its name, shape, head(), and info().
+    - For each file, prints its name and shape; with `verbose`, also head()
+      and a count of columns per dtype.
+
+    Files are read through preprocess.iter_csvs, so a later
+    preprocess.load_all_csvs on the same directory doesn't parse them again.
     """
     abs_data_dir = os.path.abspath(data_dir)
     print(f"Using data directory: {abs_data_dir}")
 
-    csv_paths = sorted(glob.glob(os.path.join(abs_data_dir, "*.csv")))
+    csv_paths = find_csvs(data_dir)
     if not csv_paths:
         print("No CSV files found in data directory.")
         return
@@ -21,23 +28,24 @@ def load_and_inspect_data(data_dir: str = "data") -> None:
     for path in csv_paths:
         print(f" - {os.path.basename(path)}")
 
-    for path in csv_paths:
+    for path, df in iter_csvs(data_dir):
         print("\n" + "=" * 80)
         print(f"File: {os.path.basename(path)}")
         print("=" * 80)
-        try:
-            df = pd.read_csv(path)
-        except Exception as e:
-            print(f"Failed to read {path}: {e}")
+        if isinstance(df, Exception):
+            print(f"Failed to read {path}: {df}")
             continue
 
         print(f"Shape: {df.shape}")
+        if not verbose:
+            continue
+
         print("\nFirst 5 rows:")
         print(df.head())
 
-        print("\nColumn info:")
-        df.info()
+        # dtype counts instead of df.info(), which scans every column
+        print("\nColumn dtypes:", df.dtypes.value_counts().to_dict())
 
 
 if __name__ == "__main__":
-    load_and_inspect_data()
+    load_and_inspect_data(verbose=True)
@@ -1,11 +1,24 @@
 import os
+import sys
 import glob
+import codecs
+import functools
+import hashlib
 import re
+import shutil
 import string
-from typing import Dict, List, Optional, Tuple
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, filterfalse
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import textblob
+from pandas.api.types import is_string_dtype
 from textblob import TextBlob
 
 try:
@@ -20,6 +33,23 @@ except Exception:  # keep optional to avoid hard failures
     nltk = None
     stopwords = None
 
+try:
+    from joblib import Parallel, delayed
+except ImportError:  # parallel sentiment scoring falls back to a single process
+    Parallel = None
+    delayed = None
+
+try:  # Numba kernel for ASCII rows; otherwise cleaning stays on the pandas path
+    try:
+        from src._clean_kernel import BYTE_CLASS, BYTE_LOWER, clean_buffer, stopword_dfa
+    except ImportError:  # run as a script from inside src/
+        from _clean_kernel import BYTE_CLASS, BYTE_LOWER, clean_buffer, stopword_dfa
+except ImportError:
+    clean_buffer = None
+
+# Bump when preprocessing output changes, to invalidate cached results.
+__version__ = "0.2.0"
+
 
 # ------------------------------------------------------------
 # Utility: stopwords and basic text cleaning
@@ -56,7 +86,15 @@ def _get_stopwords() -> set:
 
 
 ENGLISH_STOPWORDS = _get_stopwords()
+_is_stopword = frozenset(ENGLISH_STOPWORDS).__contains__
 PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+# One-pass cleaning table: drop punctuation, turn every decimal digit (what
+# the regex \d matches) into a space.
+_CLEAN_TABLE = {
+    **PUNCT_TABLE,
+    **{c: " " for c in range(sys.maxunicode + 1) if chr(c).isdecimal()},
+}
+_SENTIMENT_BATCH_SIZE = 5_000
 
 
 def clean_text(text: Optional[str]) -> str:
@@ -66,54 +104,395 @@ def clean_text(text: Optional[str]) -> str:
     """
     if not isinstance(text, str):
         return ""
+    return _clean_text_fast(text)
 
-    text = text.lower()
-    text = text.translate(PUNCT_TABLE)
-    text = re.sub(r"\d+", " ", text)
 
-    tokens = text.split()
-    tokens = [t for t in tokens if t not in ENGLISH_STOPWORDS]
-    return " ".join(tokens)
+def _clean_text_fast(
+    text: str,
+    _table=_CLEAN_TABLE,
+    _is_stop=_is_stopword,
+    _join=" ".join,
+    _filterfalse=filterfalse,
+) -> str:
+    """clean_text() without the type guard, for callers that already checked.
 
+    The table, stopword test and helpers are fixed at import, so they are bound
+    as defaults: each call then only does local (LOAD_FAST) lookups.
+    """
+    return _join(_filterfalse(_is_stop, text.lower().translate(_table).split()))
 
-def tokenize(text: Optional[str]) -> List[str]:
-    """Simple whitespace-based tokenization after basic cleaning."""
-    cleaned = clean_text(text)
+
+def tokenize(text: Optional[str], cleaned: bool = False) -> List[str]:
+    """Simple whitespace-based tokenization after basic cleaning.
+
+    Pass cleaned=True for output of clean_text() to skip cleaning it again.
+    """
     if not cleaned:
+        text = clean_text(text)
+    if not text:
         return []
-    return cleaned.split()
+    return text.split()
 
 
-def sentiment_score(text: Optional[str]) -> float:
-    """Compute TextBlob sentiment polarity in [-1, 1]."""
-    if not isinstance(text, str) or not text.strip():
-        return 0.0
+@functools.lru_cache(maxsize=100_000)
+def _sentiment_score_fast(text: str) -> float:
+    """sentiment_score() without the empty/type guard."""
     try:
         return float(TextBlob(text).sentiment.polarity)
     except Exception:
         return 0.0
 
 
+def sentiment_score(text: Optional[str]) -> float:
+    """Compute TextBlob sentiment polarity in [-1, 1].
+
+    Results are memoized, since short reviews ("gg", "good game") repeat a lot.
+    """
+    if not isinstance(text, str) or not text.strip():
+        return 0.0
+    return _sentiment_score_fast(text)
+
+
+def _score_batch(texts) -> List[float]:
+    return [_sentiment_score_fast(t) for t in texts]
+
+
+def textblob_sentiment(texts: pd.Series, n_jobs: int = 1) -> np.ndarray:
+    """TextBlob polarity for each non-empty text, optionally over n_jobs processes."""
+    values = texts.to_numpy(dtype=object)
+    if n_jobs == 1 or Parallel is None or len(values) <= _SENTIMENT_BATCH_SIZE:
+        return np.asarray(_score_batch(values), dtype=np.float32)
+
+    n_batches = -(-len(values) // _SENTIMENT_BATCH_SIZE)
+    results = Parallel(n_jobs=n_jobs, backend="loky", batch_size="auto")(
+        delayed(_score_batch)(batch) for batch in np.array_split(values, n_batches)
+    )
+    return np.fromiter(
+        chain.from_iterable(results), dtype=np.float32, count=len(values)
+    )
+
+
+def _load_lexicon() -> Dict[str, np.float32]:
+    """Load TextBlob's adjective lexicon as {word: mean polarity over senses}."""
+    path = os.path.join(
+        os.path.dirname(textblob.__file__), "en", "en-sentiment.xml"
+    )
+    polarities: Dict[str, List[float]] = {}
+    for word in ET.parse(path).getroot().iter("word"):
+        form = word.get("form", "").lower()
+        if form:
+            polarities.setdefault(form, []).append(float(word.get("polarity", 0.0)))
+    return {w: np.float32(np.mean(p)) for w, p in polarities.items()}
+
+
+LEXICON = _load_lexicon()
+_LEXICON_WORDS = pa.array(list(LEXICON), type=pa.large_string())
+_LEXICON_POLARITY = np.fromiter(
+    LEXICON.values(), dtype=np.float32, count=len(LEXICON)
+)
+
+# Token lists are stored Arrow-style: one flat string buffer plus row offsets.
+TOKENS_DTYPE = pd.ArrowDtype(pa.large_list(pa.large_string()))
+
+_STOPWORDS_ARRAY = pa.array(sorted(ENGLISH_STOPWORDS), type=pa.large_string())
+_PUNCT_PATTERN = "[" + re.escape(string.punctuation) + "]"
+if clean_buffer is not None:
+    _STOP_DFA, _STOP_ACCEPT = stopword_dfa(ENGLISH_STOPWORDS)
+
+
+def _as_arrow(values, type: pa.DataType) -> pa.Array:
+    """Contiguous Arrow array of `type` from a Series or an Arrow array."""
+    if not isinstance(values, (pa.Array, pa.ChunkedArray)):
+        values = pa.array(values, type=type)
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    return values.cast(type)
+
+
+def _scatter(values: pa.Array, mask: np.ndarray, fill) -> pa.Array:
+    """Spread `values` over the True rows of `mask`; other rows get `fill`."""
+    padded = pa.concat_arrays([values, pa.array([fill], type=values.type)])
+    indices = np.full(len(mask), len(values), dtype=np.int64)
+    indices[mask] = np.arange(len(values))
+    return padded.take(pa.array(indices))
+
+
+def _drop_tokens(parts: pa.Array, drop: pa.BooleanArray) -> pa.LargeListArray:
+    """Remove the flattened elements of list array `parts` where `drop` holds."""
+    flat = pc.list_flatten(parts)
+    keep = pc.invert(drop)
+    parents = pc.list_parent_indices(parts).to_numpy()
+    counts = np.bincount(
+        parents[keep.to_numpy(zero_copy_only=False)], minlength=len(parts)
+    )
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    return pa.LargeListArray.from_arrays(
+        pa.array(offsets, type=pa.int64()),
+        flat.filter(keep).cast(pa.large_string()),
+    )
+
+
+def _split_tokens(clean: pa.LargeStringArray) -> pa.LargeListArray:
+    """Split single-space-joined cleaned text into token lists ('' -> [])."""
+    parts = pc.split_pattern(clean, pattern=" ")
+    return _drop_tokens(parts, pc.equal(pc.list_flatten(parts), ""))
+
+
+def _is_arrow_string(dtype) -> bool:
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(
+            dtype.pyarrow_dtype
+        )
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+
+
+def _clean_with_arrow(
+    arr: pa.LargeStringArray,
+) -> Tuple[pa.LargeStringArray, pa.LargeListArray]:
+    """Vectorized clean_text() using Arrow compute kernels (no Python strings).
+
+    Only exact for ASCII text: utf8_lower() differs from str.lower() on some
+    non-ASCII letters (final sigma 'ΟΔΟΣ' -> 'οδοσ' instead of 'οδος', 'İ').
+    """
+    lowered = pc.utf8_lower(arr)
+    lowered = pc.replace_substring_regex(lowered, _PUNCT_PATTERN, "")
+    lowered = pc.replace_substring_regex(lowered, r"\p{Nd}", " ")  # like \d
+    parts = pc.utf8_split_whitespace(lowered)
+    flat = pc.list_flatten(parts)
+    # utf8_split_whitespace yields '' for leading/trailing whitespace
+    drop = pc.or_(pc.is_in(flat, value_set=_STOPWORDS_ARRAY), pc.equal(flat, ""))
+    tokens = _drop_tokens(parts, drop)
+    clean = pc.binary_join(tokens, pa.scalar(" ", type=pa.large_string()))
+    return clean, tokens
+
+
+def _clean_with_pandas(
+    texts: pd.Series,
+) -> Tuple[pa.LargeStringArray, pa.LargeListArray]:
+    """Vectorized clean_text() using pandas string methods (object/python strings)."""
+    lowered = texts.str.lower().str.translate(_CLEAN_TABLE)
+    tokens = lowered.str.split().map(lambda toks: list(filterfalse(_is_stopword, toks)))
+    tokens = _as_arrow(tokens, TOKENS_DTYPE.pyarrow_dtype)
+    clean = pc.binary_join(tokens, pa.scalar(" ", type=pa.large_string()))
+    return clean, tokens
+
+
+def _clean_with_kernel(arr: pa.LargeStringArray) -> pa.LargeStringArray:
+    """clean_text() over ASCII rows by the Numba kernel, on Arrow's buffers."""
+    if len(arr) == 0:
+        return pa.array([], type=pa.large_string())
+    _, offsets_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64)
+    offsets = offsets[arr.offset : arr.offset + len(arr) + 1]
+    data = np.frombuffer(data_buf, dtype=np.uint8)
+    out, new_offsets = clean_buffer(
+        data, offsets, _STOP_DFA, _STOP_ACCEPT, BYTE_CLASS, BYTE_LOWER
+    )
+    return pa.LargeStringArray.from_buffers(
+        len(arr), pa.py_buffer(new_offsets), pa.py_buffer(out)
+    )
+
+
+def _clean_and_tokenize(
+    texts: pd.Series,
+) -> Tuple[pa.LargeStringArray, pa.LargeListArray]:
+    """Cleaned text and tokens for non-empty `texts`, as Arrow arrays."""
+    arrow_input = _is_arrow_string(texts.dtype)
+    if texts.empty or (clean_buffer is None and not arrow_input):
+        return _clean_with_pandas(texts)
+
+    # ASCII rows go to the Numba kernel, or to Arrow kernels for Arrow-backed
+    # columns without Numba; the rest need Python's str.lower() (see
+    # _clean_with_arrow).
+    arr = _as_arrow(texts, pa.large_string())
+    ascii_rows = pc.string_is_ascii(arr).to_numpy(zero_copy_only=False)
+    if clean_buffer is not None:
+        clean = _clean_with_kernel(arr.filter(ascii_rows))
+    else:
+        clean, _ = _clean_with_arrow(arr.filter(ascii_rows))
+    if not ascii_rows.all():
+        # object dtype, so pandas doesn't lowercase them with Arrow either
+        other, _ = _clean_with_pandas(texts[~ascii_rows].astype(object))
+        n_ascii = len(clean)
+        order = np.empty(len(arr), dtype=np.int64)
+        order[ascii_rows] = np.arange(n_ascii)
+        order[~ascii_rows] = n_ascii + np.arange(len(other))
+        clean = pa.concat_arrays([clean, other]).take(pa.array(order))
+    return clean, _split_tokens(clean)
+
+
+def lexicon_sentiment(tokens) -> np.ndarray:
+    """Vectorized polarity: mean lexicon polarity of the known tokens per row.
+
+    A fast approximation of TextBlob's polarity (no negation or intensifier
+    handling). Rows without any lexicon word score 0.0.
+    """
+    arr = _as_arrow(tokens, TOKENS_DTYPE.pyarrow_dtype)
+    n_rows = len(arr)
+    word_idx = pc.index_in(pc.list_flatten(arr), value_set=_LEXICON_WORDS)
+    hit = word_idx.is_valid().to_numpy(zero_copy_only=False)
+    row_ids = pc.list_parent_indices(arr).to_numpy()[hit]
+    pol = _LEXICON_POLARITY[pc.drop_null(word_idx).to_numpy()]
+    sums = np.bincount(row_ids, weights=pol, minlength=n_rows)
+    counts = np.bincount(row_ids, minlength=n_rows)
+    return np.divide(
+        sums, counts, out=np.zeros(n_rows), where=counts > 0
+    ).astype(np.float32)
+
+
 # ------------------------------------------------------------
 # Data loading & inspection
 # ------------------------------------------------------------
 
-def read_csv_robust(path: str) -> pd.DataFrame:
-    """Read a CSV trying multiple encodings to avoid common encoding errors."""
-    encodings_to_try = ["utf-8", "utf-8-sig", "latin1"]
+def _read_csv(path: str, encoding: str, usecols: Optional[List[str]]) -> pd.DataFrame:
+    """Parse with the multithreaded pyarrow engine, falling back to the C engine."""
+    no_cols = False
+    if usecols is not None:
+        header = pd.read_csv(path, encoding=encoding, nrows=0).columns
+        usecols = [c for c in header if c in set(usecols)]
+        if not usecols:
+            # The pyarrow engine reads every column for usecols=[] (and the C
+            # engine yields no rows), so parse only the first column and drop
+            # it: the frame keeps the file's row count but has no columns.
+            usecols, no_cols = list(header[:1]), True
+    try:
+        df = pd.read_csv(
+            path,
+            encoding=encoding,
+            usecols=usecols,
+            engine="pyarrow",
+            dtype_backend="pyarrow",
+        )
+    except (TypeError, ValueError):
+        # pandas < 2.0, or input only the C parser accepts
+        df = pd.read_csv(path, encoding=encoding, usecols=usecols)
+        return df[[]] if no_cols else df
+
+    # pyarrow keeps undecodable text as binary columns instead of raising
+    for col, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.ArrowDtype) and (
+            pa.types.is_binary(dtype.pyarrow_dtype)
+            or pa.types.is_large_binary(dtype.pyarrow_dtype)
+        ):
+            raise UnicodeDecodeError(encoding, b"", 0, 1, f"column '{col}'")
+    return df[[]] if no_cols else df
+
+
+_ENCODINGS = ["utf-8", "utf-8-sig", "latin1"]
+
+
+def _detect_encoding(path: str, encodings: List[str]) -> str:
+    """Pick the first encoding that decodes the first 64 KiB of the file."""
+    with open(path, "rb") as f:
+        head = f.read(65536)
+    if head.startswith(codecs.BOM_UTF8) and "utf-8-sig" in encodings:
+        return "utf-8-sig"
+    for enc in encodings:
+        try:
+            # incremental decode so a multi-byte char cut at the boundary is fine
+            codecs.getincrementaldecoder(enc)().decode(head, final=False)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return encodings[-1]
+
+
+def read_csv_robust(path: str, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read a CSV, detecting its encoding from the head to avoid encoding errors.
+
+    The file is parsed once with the detected encoding; only if decoding
+    fails further in is each remaining common encoding tried in turn.
+    If `usecols` is given, only those of its columns present in the file are read.
+    """
+    encodings_to_try = _ENCODINGS
     last_error: Optional[Exception] = None
+    try:
+        detected = _detect_encoding(path, encodings_to_try)
+        return _read_csv(path, encoding=detected, usecols=usecols)
+    except UnicodeDecodeError as e:
+        last_error = e
+    except Exception as e:
+        raise RuntimeError(f"Failed to read {path}: {e}") from e
+
     for enc in encodings_to_try:
+        if enc == detected:
+            continue
         try:
-            return pd.read_csv(path, encoding=enc)
+            return _read_csv(path, encoding=enc, usecols=usecols)
         except Exception as e:  # pragma: no cover - diagnostic
             last_error = e
     raise RuntimeError(f"Failed to read {path} with common encodings: {last_error}")
 
 
-def load_all_csvs(data_dir: str = "data") -> Dict[str, pd.DataFrame]:
-    """Load all CSV files in a directory into a dict: {name: DataFrame}."""
+def find_csvs(data_dir: str = "data") -> List[str]:
+    """Sorted absolute paths of the CSV files in data_dir."""
+    return sorted(glob.glob(os.path.join(os.path.abspath(data_dir), "*.csv")))
+
+
+# (path, usecols) -> ((mtime, size), DataFrame). One entry per file, so an
+# edited file replaces its stale frame instead of adding another one.
+_CSV_CACHE: Dict[
+    Tuple[str, Optional[Tuple[str, ...]]], Tuple[Tuple[float, int], pd.DataFrame]
+] = {}
+
+
+def clear_csv_cache() -> None:
+    """Release the frames memoized by iter_csvs() and load_all_csvs()."""
+    _CSV_CACHE.clear()
+
+
+def _load_csv(
+    path: str, usecols: Optional[List[str]]
+) -> Union[pd.DataFrame, Exception]:
+    try:
+        stat = os.stat(path)
+        key = (path, tuple(usecols) if usecols is not None else None)
+        version = (stat.st_mtime, stat.st_size)
+        cached = _CSV_CACHE.get(key)
+        if cached is None or cached[0] != version:
+            _CSV_CACHE.pop(key, None)  # free the stale frame before re-reading
+            cached = (version, read_csv_robust(path, usecols=usecols))
+            _CSV_CACHE[key] = cached
+        # callers may add or drop columns without changing the cached frame
+        return cached[1].copy(deep=False)
+    except Exception as e:
+        return e
+
+
+def iter_csvs(
+    data_dir: str = "data", usecols: Optional[List[str]] = None
+) -> Iterator[Tuple[str, Union[pd.DataFrame, Exception]]]:
+    """Yield (path, DataFrame) for each CSV in data_dir, or (path, error).
+
+    Files are read concurrently with read_csv_robust and memoized per
+    (path, usecols) until the file's mtime or size changes, so exploring and
+    preprocessing the same directory in one session parses each file once.
+    Each caller gets a shallow copy: adding, replacing or dropping columns
+    doesn't affect the memoized frame (writing into existing column data
+    does, unless copy-on-write is enabled). clear_csv_cache() releases the
+    memoized frames.
+    """
+    csv_paths = find_csvs(data_dir)
+    if not csv_paths:
+        return
+    # Files are independent and pyarrow releases the GIL while parsing.
+    with ThreadPoolExecutor(max_workers=min(8, len(csv_paths))) as ex:
+        results = list(ex.map(lambda p: _load_csv(p, usecols), csv_paths))
+    yield from zip(csv_paths, results)
+
+
+def load_all_csvs(
+    data_dir: str = "data",
+    usecols: Optional[List[str]] = None,
+    verbose: bool = False,
+) -> Dict[str, pd.DataFrame]:
+    """Load all CSV files in a directory into a dict: {name: DataFrame}.
+
+    `usecols` restricts every file to those columns (see read_csv_robust).
+    With `verbose`, also prints each file's first rows and dtype counts.
+    """
     abs_dir = os.path.abspath(data_dir)
-    csv_paths = sorted(glob.glob(os.path.join(abs_dir, "*.csv")))
+    csv_paths = find_csvs(data_dir)
 
     if not csv_paths:
         print(f"No CSV files found in {abs_dir}")
@@ -125,23 +504,23 @@ def load_all_csvs(data_dir: str = "data") -> Dict[str, pd.DataFrame]:
         print(f" - {os.path.basename(p)}")
 
     dataframes: Dict[str, pd.DataFrame] = {}
-    for path in csv_paths:
+    for path, df in iter_csvs(data_dir, usecols=usecols):
         name = os.path.splitext(os.path.basename(path))[0]
         print("\n" + "=" * 80)
         print(f"Loading: {path}")
         print("=" * 80)
-        try:
-            df = read_csv_robust(path)
-        except Exception as e:
-            print(f"  Error reading {path}: {e}")
+        if isinstance(df, Exception):
+            print(f"  Error reading {path}: {df}")
             continue
 
         dataframes[name] = df
 
         print(f"Shape: {df.shape}")
         print("Columns:", list(df.columns))
-        print("\nFirst 5 rows:")
-        print(df.head())
+        if verbose:
+            print("Dtypes:", df.dtypes.value_counts().to_dict())
+            print("\nFirst 5 rows:")
+            print(df.head())
 
     return dataframes
 
@@ -156,6 +535,10 @@ def preprocess_reviews_df(
     new_clean_col: str = "review_clean",
     new_tokens_col: str = "review_tokens",
     new_sentiment_col: str = "sentiment_score",
+    sentiment_backend: str = "lexicon",
+    n_jobs: int = 1,
+    sentiment_dtype: str = "float32[pyarrow]",
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """Apply text cleaning, tokenization, and sentiment to a reviews DataFrame.
 
@@ -168,25 +551,177 @@ def preprocess_reviews_df(
     new_clean_col : str
         Column name for cleaned text.
     new_tokens_col : str
-        Column name for tokenized text (list of tokens).
+        Column name for tokenized text (Arrow list of strings, TOKENS_DTYPE).
     new_sentiment_col : str
-        Column name for TextBlob sentiment polarity.
+        Column name for sentiment polarity.
+    sentiment_backend : str
+        'lexicon' (default) scores tokens against the TextBlob lexicon in one
+        vectorized pass; 'textblob' runs the full TextBlob analyzer per review.
+    n_jobs : int
+        Worker processes for the 'textblob' backend (-1 uses all cores).
+    sentiment_dtype : str
+        dtype of the sentiment column. Polarity lies in [-1, 1], so float32
+        loses nothing; pass 'float64' for a plain NumPy column.
+    inplace : bool
+        Add the derived columns to `df` itself instead of returning a new
+        DataFrame. The new DataFrame shares the original columns with `df`
+        only under copy-on-write (the default from pandas 3); pandas 2.x
+        copies them unless copy-on-write is enabled, so pass inplace=True
+        there to avoid duplicating the review text.
     """
     if review_col not in df.columns:
         raise KeyError(f"Column '{review_col}' not found in DataFrame.")
+    if sentiment_backend not in ("lexicon", "textblob"):
+        raise ValueError(f"Unknown sentiment_backend: '{sentiment_backend}'")
+
+    reviews = df[review_col]
+    n_rows = len(reviews)
+    if isinstance(reviews.dtype, pd.CategoricalDtype):
+        # decode to the categories' own dtype (object or a string dtype)
+        reviews = reviews.astype(reviews.cat.categories.dtype)
+
+    # Null/empty/non-string reviews keep the defaults ('' / [] / 0.0); only
+    # the rest go through cleaning and scoring.
+    if reviews.dtype == object:
+        # .str.len() would also count bytes, lists and dicts as text
+        mask = reviews.map(lambda v: isinstance(v, str) and v != "")
+        mask = mask.to_numpy(dtype=bool)
+        texts = reviews[mask]
+    elif is_string_dtype(reviews.dtype):
+        has_text = reviews.notna() & reviews.str.len().gt(0)
+        mask = has_text.to_numpy(dtype=bool, na_value=False)
+        texts = reviews[mask]
+    else:  # not text, e.g. numbers or an all-NaN float column
+        mask = np.zeros(n_rows, dtype=bool)
+        texts = pd.Series([], dtype=object)
+
+    # Vectorized equivalent of clean_text() over the column; tokens are
+    # derived from the cleaned text instead of re-cleaning the raw reviews.
+    clean, tokens = _clean_and_tokenize(texts)
+
+    scores = np.zeros(n_rows, dtype=np.float32)
+    if sentiment_backend == "lexicon":
+        scores[mask] = lexicon_sentiment(tokens)
+    else:
+        # Score each distinct review once and map the polarities back.
+        unique_reviews = texts.drop_duplicates()
+        polarity_lut = dict(
+            zip(unique_reviews, textblob_sentiment(unique_reviews, n_jobs=n_jobs))
+        )
+        scores[mask] = texts.map(polarity_lut).to_numpy(np.float32)
+
+    derived = {
+        new_clean_col: pd.Series(
+            pd.arrays.ArrowExtensionArray(_scatter(clean, mask, "")), index=df.index
+        ),
+        new_tokens_col: pd.Series(
+            pd.arrays.ArrowExtensionArray(_scatter(tokens, mask, [])), index=df.index
+        ),
+        new_sentiment_col: pd.array(scores, dtype=sentiment_dtype),
+    }
+    if inplace:
+        for col, values in derived.items():
+            df[col] = values
+        return df
+    # Under copy-on-write (pandas >= 3, or pandas 2.x with
+    # mode.copy_on_write enabled) assign() shares the existing column data
+    # instead of copying the frame.
+    return df.assign(**derived)
+
+
+def preprocess_csv_in_chunks(
+    path: str,
+    review_col: str,
+    out_path: str = "reviews.parquet",
+    chunksize: int = 200_000,
+    usecols: Optional[List[str]] = None,
+    **preprocess_kwargs,
+) -> int:
+    """Stream a CSV through preprocess_reviews_df into a Parquet file.
+
+    Only `review_col` and the `usecols` columns (e.g. labels) are read,
+    `chunksize` rows at a time, and each processed chunk is appended to
+    `out_path`. Extra keyword arguments are passed to preprocess_reviews_df.
+    Returns the number of rows written.
+
+    Types can't be inferred per chunk (a column may be empty in one chunk and
+    text in the next), so the `usecols` columns are kept as strings; cast
+    them after loading `out_path`. If processing fails, `out_path` is left
+    untouched.
+    """
+    detected = _detect_encoding(path, _ENCODINGS)
+    encodings = [detected] + [enc for enc in _ENCODINGS if enc != detected]
+    for enc in encodings:
+        try:
+            return _write_chunks(
+                path, review_col, usecols, out_path, chunksize, enc, preprocess_kwargs
+            )
+        except UnicodeDecodeError as e:
+            # bad bytes past the sniffed head: rewrite with the next encoding
+            last_error = e
+    raise RuntimeError(f"Failed to read {path} with common encodings: {last_error}")
 
-    out = df.copy()
-    out[new_clean_col] = out[review_col].apply(clean_text)
-    out[new_tokens_col] = out[review_col].apply(tokenize)
-    out[new_sentiment_col] = out[review_col].apply(sentiment_score)
 
-    return out
+def _write_chunks(
+    path: str,
+    review_col: str,
+    usecols: Optional[List[str]],
+    out_path: str,
+    chunksize: int,
+    encoding: str,
+    preprocess_kwargs: dict,
+) -> int:
+    columns = {review_col, *(usecols or [])}
+    chunks = pd.read_csv(
+        path,
+        encoding=encoding,
+        usecols=lambda c: c in columns,
+        # fixed Arrow type so every chunk has the same Parquet schema
+        dtype={c: pd.ArrowDtype(pa.large_string()) for c in columns},
+        chunksize=chunksize,
+    )
+    tmp_path = out_path + ".tmp"
+    writer: Optional[pq.ParquetWriter] = None
+    n_rows = 0
+    done = False
+    try:
+        for chunk in chunks:
+            processed = preprocess_reviews_df(
+                chunk, review_col, inplace=True, **preprocess_kwargs
+            )
+            # pandas metadata would record ArrowDtype names that
+            # pd.read_parquet cannot parse back for list columns
+            table = pa.Table.from_pandas(
+                processed, preserve_index=False
+            ).replace_schema_metadata(None)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, table.schema)
+            writer.write_table(table)
+            n_rows += len(processed)
+        done = True
+    finally:
+        chunks.close()
+        if writer is not None:
+            writer.close()
+            # never leave a truncated file that looks like a complete result
+            if done:
+                os.replace(tmp_path, out_path)
+            else:
+                os.remove(tmp_path)
+    return n_rows
 
 
 def run_preprocessing(
     data_dir: str = "data",
     review_file_hint: Optional[str] = None,
     review_col_candidates: Optional[List[str]] = None,
+    usecols: Optional[List[str]] = None,
+    chunksize: Optional[int] = None,
+    out_path: str = "reviews.parquet",
+    cache_dir: Optional[str] = "cache",
+    verbose: bool = False,
+    sentiment_backend: str = "lexicon",
+    n_jobs: int = 1,
 ) -> Tuple[Dict[str, pd.DataFrame], Optional[pd.DataFrame]]:
     """High-level helper to load data, inspect, and preprocess review text.
 
@@ -198,58 +733,115 @@ def run_preprocessing(
         Substring hint to choose which CSV likely contains reviews (e.g. 'review').
     review_col_candidates : list of str, optional
         Candidate column names for review text (e.g. ['review', 'reviews', 'text']).
+    usecols : list of str, optional
+        Extra columns to keep (e.g. labels). When given, only these plus the
+        review column candidates are read from each CSV; otherwise all columns.
+        When streaming, the same selection is read from the review file and
+        kept in `out_path`, as strings (see preprocess_csv_in_chunks).
+    chunksize : int, optional
+        Stream the selected review file in chunks of this many rows (e.g.
+        200_000) and write the processed reviews to `out_path`, so peak memory
+        is bounded by the chunk size. Other CSVs are not loaded in this mode.
+    out_path : str
+        Parquet file written when `chunksize` is given.
+    cache_dir : str, optional
+        Directory for cached preprocessing results, keyed on the review file's
+        path, mtime and size plus the pipeline version, sentiment backend and
+        stopword list. An unchanged input is then read back from Parquet
+        instead of being reprocessed (when streaming, copied to `out_path`).
+        None disables the cache.
+    verbose : bool
+        Print each loaded file's first rows and dtype counts, not just its
+        shape and columns (when streaming, the review file's first rows).
+    sentiment_backend : str
+        'lexicon' or 'textblob'; see preprocess_reviews_df. Part of the cache
+        key, so switching backends never returns stale scores.
+    n_jobs : int
+        Worker processes for the 'textblob' backend (-1 uses all cores).
 
     Returns
     -------
     all_data : dict
-        Mapping from CSV base name to raw DataFrame.
+        Mapping from CSV base name to raw DataFrame (empty when streaming).
     processed_reviews : DataFrame or None
-        Preprocessed reviews DataFrame if a suitable file/column was found.
+        Preprocessed reviews DataFrame if a suitable file/column was found
+        (None when streaming; the result is in `out_path` instead).
     """
-    all_data = load_all_csvs(data_dir=data_dir)
+    if review_col_candidates is None:
+        review_col_candidates = ["review", "reviews", "review_text", "text"]
+
+    if chunksize is not None:
+        _run_streaming(
+            data_dir,
+            review_file_hint,
+            review_col_candidates,
+            usecols,
+            chunksize,
+            out_path,
+            cache_dir,
+            verbose,
+            sentiment_backend,
+            n_jobs,
+        )
+        return {}, None
+
+    if usecols is not None:
+        usecols = list(usecols) + review_col_candidates
+
+    all_data = load_all_csvs(data_dir=data_dir, usecols=usecols, verbose=verbose)
     processed_reviews: Optional[pd.DataFrame] = None
 
     if not all_data:
         return all_data, None
 
-    # Auto-detect a likely review file
-    review_df_name = None
-    if review_file_hint:
-        for name in all_data.keys():
-            if review_file_hint.lower() in name.lower():
-                review_df_name = name
-                break
-
-    if review_df_name is None:
-        # Fallback: just pick the main steam file if present, else first one
-        if "steam" in all_data:
-            review_df_name = "steam"
-        else:
-            review_df_name = next(iter(all_data.keys()))
-
+    review_df_name = _select_review_name(list(all_data), review_file_hint)
     df_reviews = all_data[review_df_name]
     print("\nSelected review DataFrame:", review_df_name)
     print("Columns:", list(df_reviews.columns))
 
-    # Detect review column
-    if review_col_candidates is None:
-        review_col_candidates = ["review", "reviews", "review_text", "text"]
-
-    review_col = None
-    for cand in review_col_candidates:
-        if cand in df_reviews.columns:
-            review_col = cand
-            break
-
+    review_col = _find_review_col(
+        df_reviews.columns, review_col_candidates, review_df_name
+    )
     if review_col is None:
-        print("Could not find a review text column in", review_df_name)
-        print("Tried candidates:", review_col_candidates)
-        print("Please inspect the columns above and choose the correct review column.")
         return all_data, None
 
-    print(f"Using review column: '{review_col}'")
-
-    processed_reviews = preprocess_reviews_df(df_reviews, review_col=review_col)
+    review_path = os.path.join(os.path.abspath(data_dir), f"{review_df_name}.csv")
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _cache_path(
+            cache_dir,
+            review_path,
+            review_col,
+            list(df_reviews.columns),
+            sentiment_backend,
+        )
+    # The cache holds only the derived columns; the source columns come from
+    # df_reviews, so a cache hit has the same dtypes as a fresh run.
+    derived_dtypes = {
+        "review_clean": pd.ArrowDtype(pa.large_string()),
+        "review_tokens": TOKENS_DTYPE,
+        "sentiment_score": pd.ArrowDtype(pa.float32()),
+    }
+    if cache_path is not None and os.path.exists(cache_path):
+        print(f"Loading cached preprocessed reviews: {cache_path}")
+        cached = pd.read_parquet(
+            cache_path, columns=list(derived_dtypes), dtype_backend="pyarrow"
+        )
+        processed_reviews = df_reviews.assign(
+            **{
+                col: cached[col].astype(dtype).array
+                for col, dtype in derived_dtypes.items()
+            }
+        )
+    else:
+        processed_reviews = preprocess_reviews_df(
+            df_reviews,
+            review_col=review_col,
+            sentiment_backend=sentiment_backend,
+            n_jobs=n_jobs,
+        )
+        if cache_path is not None:
+            _write_cache(processed_reviews[list(derived_dtypes)], cache_path)
     print("\nPreview of processed reviews (first 5 rows):")
     cols_to_show = [review_col, "review_clean", "review_tokens", "sentiment_score"]
     existing_cols = [c for c in cols_to_show if c in processed_reviews.columns]
@@ -258,6 +850,124 @@ def run_preprocessing(
     return all_data, processed_reviews
 
 
+def _cache_path(
+    cache_dir: str,
+    path: str,
+    review_col: str,
+    columns: List[str],
+    sentiment_backend: str,
+    streamed: bool = False,
+) -> str:
+    stat = os.stat(path)
+    raw_key = f"{path}:{stat.st_mtime}:{stat.st_size}:{__version__}:{review_col}"
+    # the stopwords vary with the environment: NLTK's list or the fallback
+    stop_key = sorted(ENGLISH_STOPWORDS)
+    # streamed output keeps other columns as strings: not shared with in-memory runs
+    key = hashlib.sha1(
+        f"{raw_key}:{columns}:{sentiment_backend}:{streamed}:{stop_key}".encode()
+    ).hexdigest()
+    return os.path.join(cache_dir, f"{key}.parquet")
+
+
+def _write_cache(df: pd.DataFrame, cache_path: str) -> None:
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    df.to_parquet(tmp_path, compression="zstd")
+    os.replace(tmp_path, cache_path)  # never leave a half-written cache entry
+
+
+def _select_review_name(names: List[str], review_file_hint: Optional[str]) -> str:
+    """Auto-detect a likely review file among CSV base names."""
+    if review_file_hint:
+        for name in names:
+            if review_file_hint.lower() in name.lower():
+                return name
+
+    # Fallback: just pick the main steam file if present, else first one
+    if "steam" in names:
+        return "steam"
+    return names[0]
+
+
+def _find_review_col(
+    columns, review_col_candidates: List[str], review_df_name: str
+) -> Optional[str]:
+    """Return the first candidate present in `columns`, reporting the outcome."""
+    for cand in review_col_candidates:
+        if cand in columns:
+            print(f"Using review column: '{cand}'")
+            return cand
+
+    print("Could not find a review text column in", review_df_name)
+    print("Tried candidates:", review_col_candidates)
+    print("Please inspect the columns above and choose the correct review column.")
+    return None
+
+
+def _run_streaming(
+    data_dir: str,
+    review_file_hint: Optional[str],
+    review_col_candidates: List[str],
+    usecols: Optional[List[str]],
+    chunksize: int,
+    out_path: str,
+    cache_dir: Optional[str],
+    verbose: bool,
+    sentiment_backend: str,
+    n_jobs: int,
+) -> None:
+    """Chunked variant of run_preprocessing for review files too big for memory."""
+    csv_paths = find_csvs(data_dir)
+    if not csv_paths:
+        print(f"No CSV files found in {os.path.abspath(data_dir)}")
+        return
+
+    paths = {os.path.splitext(os.path.basename(p))[0]: p for p in csv_paths}
+    review_df_name = _select_review_name(list(paths), review_file_hint)
+    path = paths[review_df_name]
+    encoding = _detect_encoding(path, _ENCODINGS)
+    columns = list(pd.read_csv(path, encoding=encoding, nrows=0).columns)
+    print("\nSelected review file:", path)
+    print("Columns:", columns)
+
+    review_col = _find_review_col(columns, review_col_candidates, review_df_name)
+    if review_col is None:
+        return
+
+    if usecols is not None:
+        columns = [c for c in columns if c in set(usecols) or c == review_col]
+    if verbose:
+        head = pd.read_csv(path, encoding=encoding, usecols=columns, nrows=5)
+        print("\nFirst 5 rows:")
+        print(head)
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _cache_path(
+            cache_dir, path, review_col, columns, sentiment_backend, streamed=True
+        )
+    if cache_path is not None and os.path.exists(cache_path):
+        print(f"Copying cached preprocessed reviews: {cache_path}")
+        shutil.copyfile(cache_path, out_path)
+        return
+
+    n_rows = preprocess_csv_in_chunks(
+        path,
+        review_col,
+        out_path=out_path,
+        chunksize=chunksize,
+        usecols=columns,
+        sentiment_backend=sentiment_backend,
+        n_jobs=n_jobs,
+    )
+    print(f"\nWrote {n_rows} processed reviews to {os.path.abspath(out_path)}")
+    if cache_path is not None:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        shutil.copyfile(out_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+
+
 if __name__ == "__main__":
     # When run directly, perform loading, inspection, and basic preprocessing.
     run_preprocessing(data_dir="data")
@@ -0,0 +1,71 @@
+"""run_preprocessing's Parquet cache: hits match fresh runs, changes miss."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src import preprocess
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "steam.csv").write_text(
+        "review,label\nGreat game 10/10,1\n,0\nboring and bad,0\n"
+    )
+    preprocess.clear_csv_cache()
+    yield data
+    preprocess.clear_csv_cache()
+
+
+def _run(data_dir, **kwargs):
+    _, processed = preprocess.run_preprocessing(
+        str(data_dir), cache_dir=str(data_dir.parent / "cache"), **kwargs
+    )
+    return processed
+
+
+def _count_processing(monkeypatch):
+    calls = []
+    original = preprocess.preprocess_reviews_df
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(preprocess, "preprocess_reviews_df", counting)
+    return calls
+
+
+def test_hit_matches_fresh_run(data_dir, monkeypatch):
+    calls = _count_processing(monkeypatch)
+    fresh = _run(data_dir)
+    cached = _run(data_dir)
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(cached, fresh)
+
+
+def test_backend_and_stopwords_are_part_of_the_key(data_dir, monkeypatch):
+    calls = _count_processing(monkeypatch)
+    _run(data_dir)
+    _run(data_dir, sentiment_backend="textblob")
+    assert len(calls) == 2
+
+    monkeypatch.setattr(preprocess, "ENGLISH_STOPWORDS", {"the", "a"})
+    _run(data_dir)
+    assert len(calls) == 3
+
+
+def test_edited_file_misses(data_dir, monkeypatch):
+    calls = _count_processing(monkeypatch)
+    _run(data_dir)
+    path = data_dir / "steam.csv"
+    path.write_text("review,label\nbad game,0\n")
+    os.utime(path, (0, 12345))
+
+    processed = _run(data_dir)
+    assert len(calls) == 2
+    assert list(processed["review_clean"]) == ["bad game"]
@@ -0,0 +1,75 @@
+"""The vectorized cleaning paths must agree with clean_text()/tokenize().
+
+preprocess_reviews_df picks the Numba kernel, Arrow compute kernels or pandas
+string methods depending on the column dtype, on whether Numba is installed
+and on whether a row is ASCII; every combination is checked against the
+per-string reference.
+"""
+
+import random
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src import preprocess
+
+# 'Σ' and 'İ' lowercase differently in Arrow's utf8_lower than in str.lower()
+# (final sigma, dotted capital I), so they must not reach the Arrow kernels.
+ALPHABET = list("abcXYZ019 .,'!\t\n\x1c\x1f\x00\x7f-_") + [
+    "the ",
+    "a ",
+    "An ",
+    "IS",
+    " don't ",
+    "É",
+    "\xa0",
+    "١",
+    "ß",
+    "Σ",
+    "ΟΔΟΣ ",
+    "İ",
+]
+
+DTYPES = [
+    object,
+    "str",
+    "string[pyarrow]",
+    pd.ArrowDtype(pa.string()),
+    pd.ArrowDtype(pa.large_string()),
+    "category",
+]
+
+
+def _texts(n: int = 2_000) -> list:
+    rng = random.Random(0)
+    texts = [
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 30)))
+        for _ in range(n)
+    ]
+    return texts + [
+        None,
+        "",
+        "   ",
+        "plain ascii only the best game",
+        "ΣΑΣ ΟΔΟΣ",
+        "İstanbul",
+    ]
+
+
+@pytest.mark.parametrize("use_kernel", [True, False], ids=["numba", "no-numba"])
+@pytest.mark.parametrize("dtype", DTYPES, ids=str)
+def test_matches_clean_text(dtype, use_kernel, monkeypatch):
+    if use_kernel and preprocess.clean_buffer is None:
+        pytest.skip("numba is not installed")
+    if not use_kernel:
+        monkeypatch.setattr(preprocess, "clean_buffer", None)
+
+    texts = _texts()
+    df = pd.DataFrame({"review": pd.Series(texts, dtype=dtype)})
+    out = preprocess.preprocess_reviews_df(df, "review")
+
+    assert list(out["review_clean"]) == [preprocess.clean_text(t) for t in texts]
+    assert [list(toks) for toks in out["review_tokens"]] == [
+        preprocess.tokenize(t) for t in texts
+    ]
@@ -0,0 +1,39 @@
+"""Memoized CSV loading: isolated frames, one entry per file, usecols=[]."""
+
+import os
+
+import pytest
+
+from src import preprocess
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / "steam.csv").write_text("review,label\nGreat game,1\nbad,0\n")
+    preprocess.clear_csv_cache()
+    yield tmp_path
+    preprocess.clear_csv_cache()
+
+
+def test_callers_do_not_share_mutations(data_dir):
+    first = preprocess.load_all_csvs(str(data_dir))["steam"]
+    first["junk"] = 1
+    preprocess.preprocess_reviews_df(first, "review", inplace=True)
+
+    again = preprocess.load_all_csvs(str(data_dir))["steam"]
+    assert list(again.columns) == ["review", "label"]
+
+
+def test_edited_file_replaces_cached_frame(data_dir):
+    path = data_dir / "steam.csv"
+    preprocess.load_all_csvs(str(data_dir))
+    path.write_text("review,label\nGreat game,1\nbad,0\nok,1\n")
+    os.utime(path, (0, 12345))
+
+    assert len(preprocess.load_all_csvs(str(data_dir))["steam"]) == 3
+    assert len(preprocess._CSV_CACHE) == 1
+
+
+def test_empty_usecols_reads_no_columns(data_dir):
+    (path, df), = preprocess.iter_csvs(str(data_dir), usecols=[])
+    assert df.shape == (2, 0)
@@ -0,0 +1,62 @@
+"""Chunked preprocessing must write one consistent Parquet file, or none."""
+
+import pandas as pd
+import pytest
+
+from src import preprocess
+
+
+def _write_csv(path, labels):
+    rows = [
+        f"Great game number {i},{'' if v is None else v}"
+        for i, v in enumerate(labels)
+    ]
+    path.write_text("review,label\n" + "\n".join(rows) + "\n")
+
+
+@pytest.mark.parametrize(
+    "labels",
+    [
+        [None] * 5 + ["good", "bad", None, "good", "ok"],  # empty, then text
+        [1, 2, 3, 4, 5, "abc", 7, 8, 9, 10],  # int, then text
+        [1, 2, 3, 4, 5, None, None, None, None, None],  # int, then empty
+    ],
+    ids=["null-then-text", "int-then-text", "int-then-null"],
+)
+def test_column_type_changes_across_chunks(tmp_path, labels):
+    csv_path = tmp_path / "reviews.csv"
+    out_path = tmp_path / "out.parquet"
+    _write_csv(csv_path, labels)
+
+    n_rows = preprocess.preprocess_csv_in_chunks(
+        str(csv_path), "review", out_path=str(out_path), chunksize=5, usecols=["label"]
+    )
+
+    out = pd.read_parquet(out_path)
+    assert n_rows == len(out) == len(labels)
+    assert list(out.columns[:2]) == ["review", "label"]
+    expected = [None if v is None else str(v) for v in labels]
+    assert [None if pd.isna(v) else v for v in out["label"]] == expected
+    assert out["review_clean"].iloc[0] == preprocess.clean_text("Great game number 0")
+
+
+def test_failed_run_leaves_no_output(tmp_path, monkeypatch):
+    csv_path = tmp_path / "reviews.csv"
+    out_path = tmp_path / "out.parquet"
+    _write_csv(csv_path, list(range(10)))
+
+    original = preprocess.preprocess_reviews_df
+    calls = []
+
+    def fail_on_second_chunk(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("boom")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(preprocess, "preprocess_reviews_df", fail_on_second_chunk)
+    with pytest.raises(RuntimeError, match="boom"):
+        preprocess.preprocess_csv_in_chunks(
+            str(csv_path), "review", out_path=str(out_path), chunksize=5
+        )
+    assert list(tmp_path.iterdir()) == [csv_path]